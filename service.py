@@ -17,6 +17,7 @@ import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent
+_IS_WINDOWS = platform.system() == "Windows"
 
 
 def _activate_venv_if_requested() -> None:
@@ -25,42 +26,44 @@ def _activate_venv_if_requested() -> None:
         return
 
     venv_dir = PROJECT_ROOT / ".venv"
-    if not venv_dir.exists():
+    if Path(sys.prefix).resolve() == venv_dir.resolve():
         return
 
-    is_windows = platform.system() == "Windows"
-    venv_bin = venv_dir / ("Scripts" if is_windows else "bin")
-    venv_python = venv_bin / ("python.exe" if is_windows else "python")
+    venv_bin = venv_dir / ("Scripts" if _IS_WINDOWS else "bin")
+    venv_python = venv_bin / ("python.exe" if _IS_WINDOWS else "python")
 
     if not venv_python.exists():
         return
 
     sys.executable = str(venv_python)
-    _update_path(venv_bin, is_windows)
-    _add_site_packages(venv_dir, is_windows)
+    _update_path(venv_bin)
+    _add_site_packages(venv_dir)
 
 
-def _update_path(venv_bin: Path, is_windows: bool) -> None:
+def _update_path(venv_bin: Path) -> None:
     """Update PATH environment variable to include venv bin directory."""
-    path_sep = ";" if is_windows else ":"
+    path_sep = ";" if _IS_WINDOWS else ":"
     current_path = os.environ.get("PATH", "")
     venv_bin_str = str(venv_bin)
     if venv_bin_str not in current_path:
         os.environ["PATH"] = f"{venv_bin_str}{path_sep}{current_path}"
 
 
-def _add_site_packages(venv_dir: Path, is_windows: bool) -> None:
+def _add_site_packages(venv_dir: Path) -> None:
     """Add site-packages directories to Python path."""
-    if is_windows:
-        site_packages = venv_dir / "Lib" / "site-packages"
-        if site_packages.exists():
-            site.addsitedir(str(site_packages))
+    if _IS_WINDOWS:
+        site_packages = os.path.join(str(venv_dir), "Lib", "site-packages")
+        if os.path.isdir(site_packages):
+            site.addsitedir(site_packages)
     else:
-        python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-        for lib_dir in ["lib", "lib64"]:
-            site_packages = venv_dir / lib_dir / f"python{python_version}" / "site-packages"
-            if site_packages.exists():
-                site.addsitedir(str(site_packages))
+        venv_dir_str = str(venv_dir)
+        site_subdir = os.path.join(
+            f"python{sys.version_info.major}.{sys.version_info.minor}", "site-packages"
+        )
+        for lib_dir in ("lib", "lib64"):
+            site_packages = os.path.join(venv_dir_str, lib_dir, site_subdir)
+            if os.path.isdir(site_packages):
+                site.addsitedir(site_packages)
 
 
 def main() -> int:
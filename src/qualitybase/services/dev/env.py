@@ -19,6 +19,7 @@ print_success = utils.print_success
 print_error = utils.print_error
 print_warning = utils.print_warning
 venv_exists = utils.venv_exists
+reset_venv_cache = utils.reset_venv_cache
 run_command = utils.run_command
 
 
@@ -37,6 +38,7 @@ def task_venv() -> bool:
     python_cmd = "python3" if platform.system() != "Windows" else "python"
     print_info("Creating virtual environment...")
     success, _ = run_command([python_cmd, "-m", "venv", str(VENV_DIR)], check=False)
+    reset_venv_cache()
     if not success:
         return False
 
@@ -55,6 +57,7 @@ def task_venv_clean() -> bool:
     if venv_exists():
         print_info("Removing existing virtual environment...")
         shutil.rmtree(VENV_DIR, ignore_errors=True)
+        reset_venv_cache()
         print_success("Virtual environment removed.")
     return task_venv()
 
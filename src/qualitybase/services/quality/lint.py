@@ -26,9 +26,9 @@ get_code_directories = utils.get_code_directories
 run_command = utils.run_command
 
 # Import additional utils not in common
-print_results = utils.print_results
-summarize_results = utils.summarize_results
+render_results = utils.render_results
 print_summary = utils.print_summary
+count_errors_warnings = utils.count_errors_warnings
 check_venv_required = utils.check_venv_required
 
 
@@ -118,13 +118,14 @@ def task_lint() -> bool:
     print("\n" + "-" * 70)
     print_info("2/4 - Running MyPy")
     print("-" * 70)
-    success, _ = run_command([str(mypy), *targets], check=False, capture_output=True)
+    success, output = run_command([str(mypy), *targets], check=False, capture_output=True)
+    errors, warnings = count_errors_warnings(output)
     if success:
         print_success("✓ MyPy: No type issues found")
-        results["mypy"] = {"status": True, "errors": 0, "warnings": 0}
+        results["mypy"] = {"status": True, "errors": 0, "warnings": warnings}
     else:
         print_warning("⚠ MyPy: Type issues found")
-        results["mypy"] = {"status": False, "errors": 1, "warnings": 0}
+        results["mypy"] = {"status": False, "errors": max(errors, 1), "warnings": warnings}
 
     # Pylint - Code quality and duplicate code detection
     # Note: R0801 (duplicate-code) is disabled as it flags acceptable structural duplication
@@ -155,8 +156,8 @@ def task_lint() -> bool:
         results["semgrep"] = {"status": False, "errors": 1, "warnings": 0}
 
     # Print results summary
-    print_results(results, title="Linting Results", format="table")  # type: ignore[arg-type]
-    summary = summarize_results(results)  # type: ignore[arg-type]
+    table, summary = render_results(results, title="Linting Results")  # type: ignore[arg-type]
+    print(table)
     print_summary(summary)
 
     return all(r.get("status", False) for r in results.values())
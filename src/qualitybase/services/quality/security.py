@@ -27,8 +27,7 @@ get_code_directories = utils.get_code_directories
 run_command = utils.run_command
 
 # Import additional utils not in common
-print_results = utils.print_results
-summarize_results = utils.summarize_results
+render_results = utils.render_results
 print_summary = utils.print_summary
 
 
@@ -168,8 +167,8 @@ def task_security() -> bool:
     results["semgrep"] = {"status": semgrep_success, "errors": semgrep_errors, "warnings": semgrep_warnings}
 
     # Print results summary
-    print_results(results, title="Security Results", format="table")  # type: ignore[arg-type]
-    summary = summarize_results(results)  # type: ignore[arg-type]
+    table, summary = render_results(results, title="Security Results")  # type: ignore[arg-type]
+    print(table)
     print_summary(summary)
 
     return all(r.get("status", False) for r in results.values())
@@ -23,15 +23,7 @@ def show_help(project_root: Path, usage_prefix: str = "./service.py") -> None:
     try:
         utils.PROJECT_ROOT = project_root
 
-        def _resolve_venv_dir():
-            preferred_names = [".venv", "venv"]
-            for name in preferred_names:
-                candidate = project_root / name
-                if candidate.exists():
-                    return candidate
-            return project_root / preferred_names[0]
-
-        utils.VENV_DIR = _resolve_venv_dir()
+        utils.VENV_DIR = utils.resolve_venv_dir(project_root)
         utils.VENV_BIN = utils.VENV_DIR / ("Scripts" if platform.system() == "Windows" else "bin")
         utils.PYTHON = utils.VENV_BIN / ("python.exe" if platform.system() == "Windows" else "python")
         utils.PIP = utils.VENV_BIN / ("pip.exe" if platform.system() == "Windows" else "pip")
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import os
 import platform
-import site
-import subprocess
+import re
 import sys
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -19,14 +19,93 @@ except ImportError:
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+_IS_WINDOWS = platform.system() == "Windows"
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-_env_file = PROJECT_ROOT / ".env"
-if _env_file.exists():
-    try:
-        from dotenv import load_dotenv
-        load_dotenv(_env_file)
-    except ImportError:
-        pass
+# Captured at import so the file read stays the same after PROJECT_ROOT is
+# pointed at the calling project.
+_ENV_FILE = PROJECT_ROOT / ".env"
+_dotenv_loaded = False
+_VERBOSE = False
+_FAST_SPAWN = False
+_gh_available: bool | None = None
+_added_syspaths: set[str] = set()
+_added_pathenv: set[str] = set()
+_cwd_lock = threading.Lock()
+
+
+_ENV_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+_ENV_DOUBLE_QUOTED_RE = re.compile(r'"((?:\\.|[^"\\])*)"')
+_ENV_SINGLE_QUOTED_RE = re.compile(r"'((?:\\'|[^'])*)'")
+_ENV_DOUBLE_ESCAPE_RE = re.compile(r"\\[\\'\"abfnrtv]")
+_ENV_SINGLE_ESCAPE_RE = re.compile(r"\\[\\']")
+_ENV_EXPANSION_RE = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}")
+
+
+def _decode_env_escape(match: re.Match[str]) -> str:
+    import codecs
+
+    return codecs.decode(match.group(0), "unicode-escape")
+
+
+def _parse_env_value(value: str) -> str:
+    """Parse a .env value the way python-dotenv does.
+
+    Double-quoted values decode backslash escapes and expand ``${VAR}`` /
+    ``${VAR:-default}``; single-quoted values are literal apart from ``\\'`` and
+    ``\\\\``; unquoted values drop a trailing `` #`` comment and are expanded.
+    """
+    double_quoted = _ENV_DOUBLE_QUOTED_RE.match(value)
+    if double_quoted:
+        value = _ENV_DOUBLE_ESCAPE_RE.sub(_decode_env_escape, double_quoted.group(1))
+    else:
+        single_quoted = _ENV_SINGLE_QUOTED_RE.match(value)
+        if single_quoted:
+            return _ENV_SINGLE_ESCAPE_RE.sub(lambda m: m.group(0)[1], single_quoted.group(1))
+        comment = value.find(" #")
+        if comment != -1:
+            value = value[:comment]
+        value = value.strip()
+    return _ENV_EXPANSION_RE.sub(
+        lambda m: os.environ.get(m.group(1), m.group(2) or ""),
+        value,
+    )
+
+
+def _load_env(path: Path) -> None:
+    """Set variables from a .env file without overriding existing ones.
+
+    Supports comments, ``export`` prefixes, quoting, escapes and ``${VAR}``
+    expansion; malformed lines are skipped.
+    """
+    with open(path, encoding="utf-8") as env_file:
+        for raw_line in env_file:
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("export "):
+                line = line[len("export "):]
+            key, sep, value = line.partition("=")
+            key = key.strip()
+            if not sep or not _ENV_KEY_RE.fullmatch(key):
+                continue
+            try:
+                os.environ.setdefault(key, _parse_env_value(value.strip()))
+            except (OSError, ValueError):
+                continue
+
+
+def _load_dotenv_once() -> None:
+    """Load the qualitybase .env file on first use."""
+    global _dotenv_loaded, _VERBOSE, _FAST_SPAWN
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    if _ENV_FILE.exists():
+        _load_env(_ENV_FILE)
+    # Read settings only after .env so they can be set there as well.
+    _VERBOSE = os.environ.get("QUALITYBASE_VERBOSE") == "1"
+    _FAST_SPAWN = hasattr(os, "posix_spawnp") and os.environ.get("QUALITYBASE_FAST_SPAWN", "1") == "1"
 
 
 BLUE = "\033[94m"
@@ -37,33 +116,63 @@ CYAN = "\033[96m"
 MAGENTA = "\033[95m"
 NC = "\033[0m"
 
-if platform.system() == "Windows" and not os.environ.get("ANSICON"):
+_USE_COLOR = not (_IS_WINDOWS and not os.environ.get("ANSICON"))
+
+if not _USE_COLOR:
     BLUE = GREEN = RED = YELLOW = CYAN = MAGENTA = NC = ""
 
+    def print_info(message: str) -> None:
+        """Print an info message."""
+        sys.stdout.write(message + "\n")
 
-def print_info(message: str) -> None:
-    """Print an info message."""
-    print(f"{BLUE}{message}{NC}")
+    def print_success(message: str) -> None:
+        """Print a success message."""
+        sys.stdout.write(message + "\n")
 
+    def print_error(message: str) -> None:
+        """Print an error message."""
+        sys.stderr.write(message + "\n")
 
-def print_success(message: str) -> None:
-    """Print a success message."""
-    print(f"{GREEN}{message}{NC}")
+    def print_warning(message: str) -> None:
+        """Print a warning message."""
+        sys.stdout.write(message + "\n")
 
+    def print_header(message: str) -> None:
+        """Print a header message."""
+        sys.stdout.write(message + "\n")
 
-def print_error(message: str) -> None:
-    """Print an error message."""
-    print(f"{RED}{message}{NC}", file=sys.stderr)
+else:
+    _LINE_END = NC + "\n"
 
+    def print_info(message: str) -> None:
+        """Print an info message."""
+        sys.stdout.write(BLUE + message + _LINE_END)
 
-def print_warning(message: str) -> None:
-    """Print a warning message."""
-    print(f"{YELLOW}{message}{NC}")
+    def print_success(message: str) -> None:
+        """Print a success message."""
+        sys.stdout.write(GREEN + message + _LINE_END)
 
+    def print_error(message: str) -> None:
+        """Print an error message."""
+        sys.stderr.write(RED + message + _LINE_END)
 
-def print_header(message: str) -> None:
-    """Print a header message."""
-    print(f"{CYAN}{message}{NC}")
+    def print_warning(message: str) -> None:
+        """Print a warning message."""
+        sys.stdout.write(YELLOW + message + _LINE_END)
+
+    def print_header(message: str) -> None:
+        """Print a header message."""
+        sys.stdout.write(CYAN + message + _LINE_END)
+
+
+_PASS_CELL = f"{GREEN}✓ PASS{NC}"
+_FAIL_CELL = f"{RED}✗ FAIL{NC}"
+
+
+def flush_prints() -> None:
+    """Flush pending output written by the print helpers."""
+    sys.stdout.flush()
+    sys.stderr.flush()
 
 
 def print_separator(char: str = "=", length: int = 70) -> None:
@@ -71,53 +180,115 @@ def print_separator(char: str = "=", length: int = 70) -> None:
     print(char * length)
 
 
-def _resolve_venv_dir() -> Path:
+def resolve_venv_dir(project_root: Path) -> Path:
+    """Return the project's virtual environment directory.
+
+    An activated ``.venv`` or ``venv`` of the project (``VIRTUAL_ENV``) is used
+    as is; otherwise the first existing one wins, defaulting to ``.venv``.
+    """
     preferred_names = [".venv", "venv"]
-    for name in preferred_names:
-        candidate = PROJECT_ROOT / name
+    candidates = [project_root / name for name in preferred_names]
+    active_venv = os.environ.get("VIRTUAL_ENV")
+    if active_venv and Path(active_venv) in candidates:
+        return Path(active_venv)
+    for candidate in candidates:
         if candidate.exists():
             return candidate
-    return PROJECT_ROOT / preferred_names[0]
+    return candidates[0]
+
+
+VENV_DIR = resolve_venv_dir(PROJECT_ROOT)
+VENV_BIN = VENV_DIR / ("Scripts" if _IS_WINDOWS else "bin")
+PYTHON = VENV_BIN / ("python.exe" if _IS_WINDOWS else "python")
+PIP = VENV_BIN / ("pip.exe" if _IS_WINDOWS else "pip")
 
 
-VENV_DIR = _resolve_venv_dir()
-VENV_BIN = VENV_DIR / ("Scripts" if platform.system() == "Windows" else "bin")
-PYTHON = VENV_BIN / ("python.exe" if platform.system() == "Windows" else "python")
-PIP = VENV_BIN / ("pip.exe" if platform.system() == "Windows" else "pip")
+@functools.lru_cache(maxsize=8)
+def _python_exists(python: Path) -> bool:
+    return python.exists()
 
 
 def venv_exists() -> bool:
-    """Check if virtual environment exists."""
-    return VENV_DIR.exists() and PYTHON.exists()
+    """Check if virtual environment exists.
+
+    The result is cached per interpreter path; call reset_venv_cache() after
+    creating or removing the virtual environment.
+    """
+    return _python_exists(PYTHON)
+
+
+def reset_venv_cache() -> None:
+    """Forget cached venv_exists() results."""
+    _python_exists.cache_clear()
 
 
 def ensure_virtualenv() -> None:
     """Activate virtual environment if available."""
+    _load_dotenv_once()
     venv_dir = PROJECT_ROOT / ".venv"
-    if not venv_dir.exists():
-        return
-
-    venv_bin = venv_dir / ("Scripts" if platform.system() == "Windows" else "bin")
-    venv_python = venv_bin / ("python.exe" if platform.system() == "Windows" else "python")
+    venv_bin = venv_dir / ("Scripts" if _IS_WINDOWS else "bin")
+    venv_python = venv_bin / ("python.exe" if _IS_WINDOWS else "python")
 
     if venv_python.exists():
         sys.executable = str(venv_python)
-        path_sep = ";" if platform.system() == "Windows" else ":"
-        current_path = os.environ.get("PATH", "")
+        path_sep = ";" if _IS_WINDOWS else ":"
         venv_bin_str = str(venv_bin)
-        if venv_bin_str not in current_path:
-            os.environ["PATH"] = f"{venv_bin_str}{path_sep}{current_path}"
-
-        if platform.system() == "Windows":
-            site_packages = venv_dir / "Lib" / "site-packages"
-            if site_packages.exists():
-                site.addsitedir(str(site_packages))
+        if venv_bin_str not in _added_pathenv:
+            current_path = os.environ.get("PATH", "")
+            if venv_bin_str not in current_path:
+                os.environ["PATH"] = f"{venv_bin_str}{path_sep}{current_path}"
+            _added_pathenv.add(venv_bin_str)
+
+        import site
+
+        if _IS_WINDOWS:
+            site_packages = os.path.join(str(venv_dir), "Lib", "site-packages")
+            if os.path.isdir(site_packages):
+                site.addsitedir(site_packages)
         else:
-            python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-            for lib_dir in ["lib", "lib64"]:
-                site_packages = venv_dir / lib_dir / f"python{python_version}" / "site-packages"
-                if site_packages.exists():
-                    site.addsitedir(str(site_packages))
+            venv_dir_str = str(venv_dir)
+            site_subdir = os.path.join(
+                f"python{sys.version_info.major}.{sys.version_info.minor}", "site-packages"
+            )
+            for lib_dir in ("lib", "lib64"):
+                site_packages = os.path.join(venv_dir_str, lib_dir, site_subdir)
+                if os.path.isdir(site_packages):
+                    site.addsitedir(site_packages)
+
+
+def _fast_spawn(cmd: Sequence[str]) -> int | None:
+    """Spawn a command with posix_spawnp, sharing our stdio, and wait for its exit code.
+
+    Returns None without spawning when the current directory is not PROJECT_ROOT,
+    since posix_spawn has no chdir action.
+    """
+    import signal
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with _cwd_lock:
+        if os.getcwd() != str(PROJECT_ROOT):
+            return None
+        # Python ignores SIGPIPE and SIGXFSZ; restore the defaults in the child as
+        # subprocess does with restore_signals=True.
+        pid = os.posix_spawnp(
+            cmd[0],
+            list(cmd),
+            os.environ,
+            setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+        )
+    try:
+        _, wait_status = os.waitpid(pid, 0)
+    except BaseException:
+        # Same as subprocess.run: never leave the child running on interrupt.
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    return os.waitstatus_to_exitcode(wait_status)
+
+
+def _decode_output(data: bytes | None) -> str:
+    return data.decode("utf-8", errors="replace") if data else ""
 
 
 def run_command(
@@ -127,34 +298,210 @@ def run_command(
     **kwargs: Any,
 ) -> tuple[bool, str | None]:
     """Run a command and return success status and output."""
-    printable = " ".join(cmd)
-    print_info(f"Running: {printable}")
+    import subprocess
+
+    _load_dotenv_once()
+    if _VERBOSE:
+        import shlex
+
+        print_info(f"Running: {shlex.join(cmd)}")
+
+    if _FAST_SPAWN and not capture_output and not kwargs:
+        try:
+            returncode = _fast_spawn(cmd)
+        except FileNotFoundError:
+            print_error(f"Command not found: {cmd[0]}")
+            return (False, None)
+        if returncode is not None:
+            if check and returncode != 0:
+                print_error(f"Command exited with code {returncode}")
+            return (returncode == 0, None)
+
+    if capture_output:
+        # Merge stderr into a single binary pipe and decode once at the end;
+        # stdin is closed since captured tools cannot show a prompt anyway.
+        kwargs.setdefault("stdin", subprocess.DEVNULL)
+        kwargs.setdefault("stdout", subprocess.PIPE)
+        kwargs.setdefault("stderr", subprocess.STDOUT)
 
     try:
-        result = subprocess.run(
-            cmd,
-            check=check,
-            cwd=PROJECT_ROOT,
-            capture_output=capture_output,
-            text=True if capture_output else None,
-            **kwargs,
-        )
-        output = result.stdout if capture_output else None
+        result = subprocess.run(cmd, check=check, cwd=PROJECT_ROOT, **kwargs)
+        output = _decode_output(result.stdout) if capture_output else None
         return (result.returncode == 0, output)
     except subprocess.CalledProcessError as exc:
         print_error(f"Command exited with code {exc.returncode}")
-        output = exc.stdout if capture_output else None
+        output = _decode_output(exc.stdout) if capture_output else None
         return (False, output)
     except FileNotFoundError:
         print_error(f"Command not found: {cmd[0]}")
         return (False, None)
 
 
-def get_code_directories() -> list[str]:
-    """Get list of code directories to check."""
+def run_command_batch(
+    cmds: Sequence[Sequence[str]],
+    stop_on_fail: bool = True,
+    capture_output: bool = False,
+) -> tuple[bool, str | None]:
+    """Run several commands in a single shell invocation.
+
+    With stop_on_fail, commands are chained with ``&&``; otherwise every command
+    runs and the batch fails if any of them failed. Falls back to sequential
+    run_command calls on Windows, where no POSIX shell is available.
+    """
+    if not cmds:
+        return (True, None)
+
+    if _IS_WINDOWS:
+        success = True
+        outputs = []
+        for cmd in cmds:
+            cmd_success, output = run_command(cmd, check=False, capture_output=capture_output)
+            success = success and cmd_success
+            if output:
+                outputs.append(output)
+            if not cmd_success and stop_on_fail:
+                break
+        return (success, "".join(outputs) if capture_output else None)
+
+    import shlex
+
+    if stop_on_fail:
+        script = " && ".join(shlex.join(cmd) for cmd in cmds)
+    else:
+        script = "status=0; "
+        script += "; ".join(f"{shlex.join(cmd)} || status=1" for cmd in cmds)
+        script += "; exit $status"
+    return run_command(["sh", "-c", script], check=False, capture_output=capture_output)
+
+
+def run_commands_parallel(
+    cmds: Sequence[Sequence[str]],
+    capture_output: bool = False,
+) -> tuple[bool, str | None]:
+    """Run independent commands concurrently and return combined status and output.
+
+    Only use this for tools that do not write to the same files.
+    """
+    if not cmds:
+        return (True, None)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Load .env before any worker spawns so no child starts with a partial
+    # environment and os.environ is not modified while workers read it.
+    _load_dotenv_once()
+    with ThreadPoolExecutor(max_workers=min(len(cmds), os.cpu_count() or 1)) as executor:
+        results = list(
+            executor.map(
+                lambda cmd: run_command(cmd, check=False, capture_output=capture_output),
+                cmds,
+            )
+        )
+
+    success = all(cmd_success for cmd_success, _ in results)
+    if not capture_output:
+        return (success, None)
+    return (success, "".join(output or "" for _, output in results))
+
+
+_INPROC_TOOL_MODULES = {
+    "mypy": "mypy.api",
+    "pytest": "pytest",
+}
+_INPROC_SINGLE_USE = {"pytest"}
+_inproc_modules: dict[str, Any] = {}
+_inproc_spent: set[str] = set()
+
+
+def _run_mypy_inproc(module: Any, args: list[str], capture_output: bool) -> tuple[int, str]:
+    # mypy.api.run always buffers its report; run_tool_inproc prints it when not capturing.
+    stdout, stderr, exit_status = module.run(args)
+    return (exit_status, stdout + stderr)
+
+
+def _run_pytest_inproc(module: Any, args: list[str], capture_output: bool) -> tuple[int, str]:
+    if not capture_output:
+        return (int(module.main(args)), "")
+
+    import contextlib
+    import io
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        exit_code = module.main(args)
+    return (int(exit_code), buffer.getvalue())
+
+
+_INPROC_RUNNERS = {
+    "mypy": _run_mypy_inproc,
+    "pytest": _run_pytest_inproc,
+}
+
+
+def _in_project_venv() -> bool:
+    """Return True when this interpreter runs from the project virtual environment."""
+    try:
+        return Path(sys.prefix).resolve() == VENV_DIR.resolve()
+    except OSError:
+        return False
+
+
+def run_tool_inproc(
+    name: str,
+    args: Sequence[str],
+    capture_output: bool = False,
+) -> tuple[bool, str | None]:
+    """Run a Python tool through its programmatic API in the current interpreter.
+
+    Tools only run in-process when this interpreter is the project venv, so they
+    see the project's packages. The tool module is imported once and reused;
+    pytest runs in-process only once, since repeated pytest.main calls would
+    reuse stale test modules. Everything else falls back to run_command.
+    """
+    module = None
+    if name in _INPROC_TOOL_MODULES and name not in _inproc_spent and _in_project_venv():
+        module = _inproc_modules.get(name)
+        if module is None:
+            import importlib
+
+            try:
+                module = importlib.import_module(_INPROC_TOOL_MODULES[name])
+            except ImportError:
+                module = None
+            else:
+                _inproc_modules[name] = module
+
+    if module is None:
+        executable = VENV_BIN / (f"{name}.exe" if _IS_WINDOWS else name)
+        cmd = [str(executable) if executable.exists() else name, *args]
+        return run_command(cmd, check=False, capture_output=capture_output)
+
+    _load_dotenv_once()
+    if _VERBOSE:
+        import shlex
+
+        print_info(f"Running (in-process): {shlex.join([name, *args])}")
+    if name in _INPROC_SINGLE_USE:
+        _inproc_spent.add(name)
+    # The lock keeps the fast spawn path in run_command from seeing the
+    # temporary working directory.
+    with _cwd_lock:
+        cwd = os.getcwd()
+        os.chdir(PROJECT_ROOT)
+        try:
+            exit_code, output = _INPROC_RUNNERS[name](module, list(args), capture_output)
+        finally:
+            os.chdir(cwd)
+    if not capture_output and output:
+        sys.stdout.write(output)
+    return (exit_code == 0, output if capture_output else None)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_code_directories(project_root: Path) -> tuple[str, ...]:
     code_dirs = []
     for potential_dir in ["src", "."]:
-        path = PROJECT_ROOT / potential_dir
+        path = project_root / potential_dir
         if path.exists():
             for item in path.iterdir():
                 if (
@@ -164,18 +511,26 @@ def get_code_directories() -> list[str]:
                 ):
                     init_file = item / "__init__.py"
                     if init_file.exists():
-                        code_dirs.append(str(item.relative_to(PROJECT_ROOT)))
-            if not code_dirs and path != PROJECT_ROOT and any(path.glob("*.py")):
-                code_dirs.append(str(path.relative_to(PROJECT_ROOT)))
+                        code_dirs.append(str(item.relative_to(project_root)))
+            if not code_dirs and path != project_root and any(path.glob("*.py")):
+                code_dirs.append(str(path.relative_to(project_root)))
 
-    django_app = PROJECT_ROOT / "django_app_example"
+    django_app = project_root / "django_app_example"
     if django_app.exists() and django_app.is_dir() and "django_app_example" not in code_dirs:
         code_dirs.append("django_app_example")
 
     if not code_dirs:
         code_dirs = ["."]
 
-    return code_dirs
+    return tuple(code_dirs)
+
+
+def get_code_directories() -> list[str]:
+    """Get list of code directories to check.
+
+    The directory scan is cached per project root.
+    """
+    return list(_scan_code_directories(PROJECT_ROOT))
 
 
 def build_semgrep_command(semgrep: Path, targets: list[str]) -> list[str]:
@@ -194,44 +549,92 @@ def build_semgrep_command(semgrep: Path, targets: list[str]) -> list[str]:
     return semgrep_cmd
 
 
-def format_results_table(
+def _collect_results(
     results: dict[str, bool | dict[str, Any]],
-    title: str | None = None,
     show_status: bool = True,
-) -> str:
-    """Format results as a table."""
-    if not results:
-        return "No results available."
+) -> tuple[list[list[Any]], dict[str, Any]]:
+    """Build table rows and summary statistics in a single pass over results."""
+    rows: list[list[Any]] = []
+    passed = 0
+    total_errors = 0
+    total_warnings = 0
 
-    rows = []
     for tool, result in results.items():
         if isinstance(result, dict):
             status = result.get("status", False)
             details = result.get("details", "")
             errors = result.get("errors", 0)
             warnings = result.get("warnings", 0)
+            total_errors += errors
+            total_warnings += warnings
             if errors or warnings:
                 details = f"Errors: {errors}, Warnings: {warnings}"
         else:
             status = bool(result)
             details = ""
 
-        row_data = {"Tool": tool}
+        if status:
+            passed += 1
+
         if show_status:
-            status_str = f"{GREEN}✓ PASS{NC}" if status else f"{RED}✗ FAIL{NC}"
-            row_data["Status"] = status_str
-        row_data["Details"] = details
-        rows.append(row_data)
+            rows.append([tool, _PASS_CELL if status else _FAIL_CELL, details])
+        else:
+            rows.append([tool, details])
+
+    total = len(results)
+    summary = {
+        "total": total,
+        "passed": passed,
+        "failed": total - passed,
+        "success_rate": (passed / total * 100) if total > 0 else 0,
+        "total_errors": total_errors,
+        "total_warnings": total_warnings,
+    }
+    return (rows, summary)
+
+
+def _render_result_lines(
+    results: dict[str, bool | dict[str, Any]],
+    title: str | None = None,
+    show_status: bool = True,
+) -> tuple[list[str], dict[str, Any]]:
+    """Render the results table as output lines, with the summary, in one pass."""
+    rows, summary = _collect_results(results, show_status=show_status)
+    if not rows:
+        return (["No results available."], summary)
 
-    table = format_tabulate(rows, empty_message="No results available.")
+    headers = ["Tool", "Status", "Details"] if show_status else ["Tool", "Details"]
+    table = format_tabulate(rows, empty_message="No results available.", headers=headers)
 
     if title:
-        return f"\n{title}\n{'=' * 70}\n{table}"
+        return (["", title, "=" * 70, table], summary)
+    return ([table], summary)
+
+
+def render_results(
+    results: dict[str, bool | dict[str, Any]],
+    title: str | None = None,
+    show_status: bool = True,
+) -> tuple[str, dict[str, Any]]:
+    """Format results as a table and summarize them in one pass."""
+    lines, summary = _render_result_lines(results, title=title, show_status=show_status)
+    return ("\n".join(lines), summary)
+
+
+def format_results_table(
+    results: dict[str, bool | dict[str, Any]],
+    title: str | None = None,
+    show_status: bool = True,
+) -> str:
+    """Format results as a table."""
+    table, _ = render_results(results, title=title, show_status=show_status)
     return table
 
 
 def format_results_json(results: dict[str, bool | dict[str, Any]]) -> str:
     """Format results as JSON."""
+    import json
+
     json_results = {}
     for tool, result in results.items():
         if isinstance(result, dict):
@@ -253,39 +656,31 @@ def print_results(
         output = format_results_json(results)
         print(output)
     else:
-        output = format_results_table(results, title=title, show_status=show_status)
-        print(output)
+        lines, _ = _render_result_lines(results, title=title, show_status=show_status)
+        print(*lines, sep="\n")
 
 
 def summarize_results(results: dict[str, bool | dict[str, Any]]) -> dict[str, Any]:
     """Summarize results into statistics."""
-    total = len(results)
-    passed = 0
-    failed = 0
-    total_errors = 0
-    total_warnings = 0
+    _, summary = _collect_results(results, show_status=False)
+    return summary
 
-    for _tool, result in results.items():
-        if isinstance(result, dict):
-            status = result.get("status", False)
-            total_errors += result.get("errors", 0)
-            total_warnings += result.get("warnings", 0)
-        else:
-            status = bool(result)
 
-        if status:
-            passed += 1
-        else:
-            failed += 1
+_ERR_WARN_RE = re.compile(r"\b(error|warning):", re.IGNORECASE)
 
-    return {
-        "total": total,
-        "passed": passed,
-        "failed": failed,
-        "success_rate": (passed / total * 100) if total > 0 else 0,
-        "total_errors": total_errors,
-        "total_warnings": total_warnings,
-    }
+
+def count_errors_warnings(output: str | None) -> tuple[int, int]:
+    """Count "error:" and "warning:" diagnostic labels in tool output."""
+    if not output:
+        return (0, 0)
+    errors = 0
+    warnings = 0
+    for match in _ERR_WARN_RE.finditer(output):
+        if match.group(1).lower() == "error":
+            errors += 1
+        else:
+            warnings += 1
+    return (errors, warnings)
 
 
 def print_summary(summary: dict[str, Any]) -> None:
@@ -310,8 +705,11 @@ def load_service_utils() -> Any:
 
     _services_dir = Path(__file__).resolve().parent
     _project_root = _services_dir.parent
-    if str(_project_root) not in sys.path:
-        sys.path.insert(0, str(_project_root))
+    project_root_str = str(_project_root)
+    if project_root_str not in _added_syspaths:
+        if project_root_str not in sys.path:
+            sys.path.insert(0, project_root_str)
+        _added_syspaths.add(project_root_str)
 
     from services import utils
     return utils
@@ -319,6 +717,7 @@ def load_service_utils() -> Any:
 
 def run_service_command(command_func: Any, *args: Any, **kwargs: Any) -> int:
     """Run a service command with standardized error handling."""
+    _load_dotenv_once()
     try:
         success = command_func(*args, **kwargs)
         return 0 if success else 1
@@ -343,37 +742,41 @@ def check_venv_required() -> bool:
 
 def check_github_cli() -> bool:
     """Check if GitHub CLI is available."""
-    import subprocess
+    global _gh_available
+    if _gh_available is None:
+        import shutil
 
-    gh_result = subprocess.run(
-        ["gh", "--version"],
-        capture_output=True,
-        text=True,
-    )
-    if gh_result.returncode != 0:
+        _gh_available = shutil.which("gh") is not None
+    if not _gh_available:
         print_error("GitHub CLI (gh) not found. Install from: https://cli.github.com/")
-        return False
-    return True
+    return _gh_available
 
 
 def format_tabulate(
-    data: dict[str, Any] | list[dict[str, Any]],
+    data: dict[str, Any] | list[dict[str, Any]] | list[list[Any]],
     empty_message: str = "No data available.",
+    headers: Sequence[str] | None = None,
 ) -> str:
-    """Format data as a table using tabulate."""
+    """Format data as a table using tabulate.
+
+    Rows may be given as lists together with explicit headers, which skips the
+    per-row key lookups tabulate performs for dict rows.
+    """
     if not data:
         return empty_message
 
     if tabulate is None:
         raise ImportError("tabulate is required. Install it with: pip install tabulate")
 
+    rows: list[dict[str, Any]] | list[list[Any]]
     if isinstance(data, dict):
-        rows = []
+        dict_rows: list[dict[str, Any]] = []
         for k, v in data.items():
             if isinstance(v, dict):
-                rows.append({"key": k, **v})
+                dict_rows.append({"key": k, **v})
             else:
-                rows.append({"key": k, "value": v})
+                dict_rows.append({"key": k, "value": v})
+        rows = dict_rows
     else:
         rows = data
 
@@ -382,7 +785,7 @@ def format_tabulate(
 
     if tabulate is None:
         return empty_message
-    result = tabulate(rows, headers="keys", tablefmt="grid")
+    result = tabulate(rows, headers=headers or "keys", tablefmt="grid")
     return str(result)  # type: ignore[no-any-return]
 
 
@@ -402,10 +805,13 @@ def get_quality_common_imports() -> dict[str, Any]:
         "print_warning": print_warning,
         "print_header": print_header,
         "print_separator": print_separator,
+        "flush_prints": flush_prints,
         "venv_exists": venv_exists,
         "get_code_directories": get_code_directories,
         "run_command": run_command,
+        "run_command_batch": run_command_batch,
+        "run_commands_parallel": run_commands_parallel,
+        "run_tool_inproc": run_tool_inproc,
         "check_venv_required": check_venv_required,
         "snake_to_camel": snake_to_camel,
     }
-
@@ -0,0 +1,293 @@
+"""Tests for qualitybase.services.utils."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from qualitybase.services import utils
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="requires a POSIX shell")
+
+def _load(tmp_path, monkeypatch, content, environ=None):
+    monkeypatch.setattr(os, "environ", dict(environ or {}))
+    env_file = tmp_path / ".env"
+    env_file.write_text(content, encoding="utf-8")
+    utils._load_env(env_file)
+
+
+def test_load_env_parses_values(tmp_path, monkeypatch):
+    _load(
+        tmp_path,
+        monkeypatch,
+        "# comment\n"
+        "\n"
+        "PLAIN=value\n"
+        'DOUBLE="two words"\n'
+        "SINGLE='a=b'\n"
+        "export EXPORTED=yes\n"
+        "INLINE=1 # trailing comment\n"
+        'QUOTED_HASH="x # y" # comment\n'
+        "EMPTY=\n",
+    )
+
+    assert os.environ["PLAIN"] == "value"
+    assert os.environ["DOUBLE"] == "two words"
+    assert os.environ["SINGLE"] == "a=b"
+    assert os.environ["EXPORTED"] == "yes"
+    assert os.environ["INLINE"] == "1"
+    assert os.environ["QUOTED_HASH"] == "x # y"
+    assert os.environ["EMPTY"] == ""
+
+
+def test_load_env_does_not_override_existing(tmp_path, monkeypatch):
+    _load(tmp_path, monkeypatch, "EXISTING=replaced\n", environ={"EXISTING": "kept"})
+
+    assert os.environ["EXISTING"] == "kept"
+
+
+def test_load_env_decodes_escapes(tmp_path, monkeypatch):
+    _load(
+        tmp_path,
+        monkeypatch,
+        'QUOTE="x\\"y"\n'
+        'LINES="l1\\nl2"\n'
+        "RAW='l1\\nl2'\n"
+        "ESCAPED='it\\'s'\n",
+    )
+
+    assert os.environ["QUOTE"] == 'x"y'
+    assert os.environ["LINES"] == "l1\nl2"
+    assert os.environ["RAW"] == "l1\\nl2"
+    assert os.environ["ESCAPED"] == "it's"
+
+
+def test_load_env_expands_variables(tmp_path, monkeypatch):
+    _load(
+        tmp_path,
+        monkeypatch,
+        "FIRST=one\n"
+        "UNQUOTED=${HOME}/z\n"
+        'DOUBLE="${FIRST}-${MISSING:-fallback}"\n'
+        "SINGLE='${HOME}'\n"
+        "EMPTY=${MISSING}\n",
+        environ={"HOME": "/home/me"},
+    )
+
+    assert os.environ["UNQUOTED"] == "/home/me/z"
+    assert os.environ["DOUBLE"] == "one-fallback"
+    assert os.environ["SINGLE"] == "${HOME}"
+    assert os.environ["EMPTY"] == ""
+
+
+def test_load_env_skips_malformed_lines(tmp_path, monkeypatch):
+    _load(
+        tmp_path,
+        monkeypatch,
+        "=oops\n"
+        "no separator\n"
+        "BAD KEY=1\n"
+        "PLAIN=after\n",
+    )
+
+    assert os.environ["PLAIN"] == "after"
+    assert "BAD KEY" not in os.environ
+
+
+def test_quality_common_imports_follow_project_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(utils, "VENV_BIN", tmp_path / ".venv" / "bin")
+
+    common = utils.get_quality_common_imports()
+
+    assert common["PROJECT_ROOT"] == tmp_path
+    assert common["VENV_BIN"] == tmp_path / ".venv" / "bin"
+    assert common["run_command"] is utils.run_command
+
+
+def test_resolve_venv_dir_prefers_active_project_venv(tmp_path, monkeypatch):
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / "venv").mkdir()
+    monkeypatch.setenv("VIRTUAL_ENV", str(tmp_path / "venv"))
+
+    assert utils.resolve_venv_dir(tmp_path) == tmp_path / "venv"
+
+
+def test_resolve_venv_dir_ignores_foreign_active_venv(tmp_path, monkeypatch):
+    (tmp_path / "venv").mkdir()
+    monkeypatch.setenv("VIRTUAL_ENV", str(tmp_path / "elsewhere"))
+
+    assert utils.resolve_venv_dir(tmp_path) == tmp_path / "venv"
+
+
+def test_resolve_venv_dir_defaults_to_dot_venv(tmp_path, monkeypatch):
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+
+    assert utils.resolve_venv_dir(tmp_path) == tmp_path / ".venv"
+
+
+def test_count_errors_warnings():
+    output = (
+        "app.py:1: error: Incompatible types\n"
+        "app.py:2: Warning: unused\n"
+        "Found 1 error in 1 file\n"
+    )
+
+    assert utils.count_errors_warnings(output) == (1, 1)
+    assert utils.count_errors_warnings(None) == (0, 0)
+
+
+def _run_batch(tmp_path, monkeypatch, cmds, **kwargs):
+    monkeypatch.setattr(utils, "PROJECT_ROOT", tmp_path)
+    calls = []
+    original = utils.run_command
+
+    def recording_run_command(cmd, *args, **kw):
+        calls.append(list(cmd))
+        return original(cmd, *args, **kw)
+
+    monkeypatch.setattr(utils, "run_command", recording_run_command)
+    return utils.run_command_batch(cmds, capture_output=True, **kwargs), calls
+
+
+@posix_only
+def test_run_command_batch_stops_on_first_failure(tmp_path, monkeypatch):
+    result, calls = _run_batch(tmp_path, monkeypatch, [["echo", "a b"], ["false"], ["echo", "c"]])
+
+    assert result == (False, "a b\n")
+    assert calls == [["sh", "-c", "echo 'a b' && false && echo c"]]
+
+
+@posix_only
+def test_run_command_batch_runs_all_without_stop_on_fail(tmp_path, monkeypatch):
+    result, calls = _run_batch(
+        tmp_path,
+        monkeypatch,
+        [["echo", "a b"], ["false"], ["echo", "c"]],
+        stop_on_fail=False,
+    )
+
+    assert result == (False, "a b\nc\n")
+    assert calls == [[
+        "sh",
+        "-c",
+        "status=0; echo 'a b' || status=1; false || status=1; echo c || status=1; exit $status",
+    ]]
+
+
+@posix_only
+def test_run_command_batch_succeeds_when_all_pass(tmp_path, monkeypatch):
+    result, _ = _run_batch(tmp_path, monkeypatch, [["true"], ["echo", "ok"]], stop_on_fail=False)
+
+    assert result == (True, "ok\n")
+
+
+def test_run_command_batch_empty(tmp_path, monkeypatch):
+    result, calls = _run_batch(tmp_path, monkeypatch, [])
+
+    assert result == (True, None)
+    assert calls == []
+
+
+class _FakePytest:
+    def __init__(self):
+        self.calls = []
+
+    def main(self, args):
+        self.calls.append(args)
+        print("fake pytest output")
+        return 0
+
+
+def _setup_inproc(tmp_path, monkeypatch, in_venv):
+    fake = _FakePytest()
+    fallback_calls = []
+
+    def fake_run_command(cmd, check=True, capture_output=False, **kwargs):
+        fallback_calls.append(list(cmd))
+        return (True, "subprocess output" if capture_output else None)
+
+    monkeypatch.setattr(utils, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(utils, "VENV_DIR", Path(sys.prefix) if in_venv else tmp_path / ".venv")
+    monkeypatch.setattr(utils, "VENV_BIN", tmp_path / ".venv" / "bin")
+    monkeypatch.setattr(utils, "run_command", fake_run_command)
+    monkeypatch.setattr(utils, "_inproc_spent", set())
+    monkeypatch.setitem(utils._inproc_modules, "pytest", fake)
+    return fake, fallback_calls
+
+
+def test_run_tool_inproc_falls_back_outside_project_venv(tmp_path, monkeypatch):
+    fake, fallback_calls = _setup_inproc(tmp_path, monkeypatch, in_venv=False)
+
+    result = utils.run_tool_inproc("pytest", ["-q"], capture_output=True)
+
+    assert result == (True, "subprocess output")
+    assert fake.calls == []
+    assert fallback_calls == [["pytest", "-q"]]
+
+
+def test_run_tool_inproc_runs_pytest_in_process_only_once(tmp_path, monkeypatch):
+    fake, fallback_calls = _setup_inproc(tmp_path, monkeypatch, in_venv=True)
+    cwd = os.getcwd()
+
+    first = utils.run_tool_inproc("pytest", ["-q"], capture_output=True)
+    second = utils.run_tool_inproc("pytest", ["-q"], capture_output=True)
+
+    assert first == (True, "fake pytest output\n")
+    assert second == (True, "subprocess output")
+    assert fake.calls == [["-q"]]
+    assert fallback_calls == [["pytest", "-q"]]
+    assert os.getcwd() == cwd
+
+
+def test_run_tool_inproc_streams_output_when_not_capturing(tmp_path, monkeypatch, capsys):
+    _setup_inproc(tmp_path, monkeypatch, in_venv=True)
+
+    result = utils.run_tool_inproc("pytest", ["-q"])
+
+    assert result == (True, None)
+    assert capsys.readouterr().out == "fake pytest output\n"
+
+
+@posix_only
+@pytest.mark.parametrize("fast_spawn", [True, False])
+@pytest.mark.parametrize(
+    ("cmd", "check", "expected", "message"),
+    [
+        (["true"], True, (True, None), ""),
+        (["false"], True, (False, None), "Command exited with code 1"),
+        (["false"], False, (False, None), ""),
+        (["qualitybase-missing-command"], True, (False, None), "Command not found: qualitybase-missing-command"),
+    ],
+)
+def test_run_command_fast_spawn_matches_subprocess(
+    tmp_path, monkeypatch, capsys, fast_spawn, cmd, check, expected, message
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(utils, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(utils, "_dotenv_loaded", True)
+    monkeypatch.setattr(utils, "_VERBOSE", False)
+    monkeypatch.setattr(utils, "_FAST_SPAWN", fast_spawn)
+    if fast_spawn:
+        spawned = []
+        original = utils._fast_spawn
+
+        def recording_fast_spawn(spawn_cmd):
+            spawned.append(list(spawn_cmd))
+            return original(spawn_cmd)
+
+        monkeypatch.setattr(utils, "_fast_spawn", recording_fast_spawn)
+
+    result = utils.run_command(cmd, check=check)
+
+    assert result == expected
+    err = capsys.readouterr().err
+    if message:
+        assert message in err
+    else:
+        assert err == ""
+    if fast_spawn:
+        assert spawned == [cmd]